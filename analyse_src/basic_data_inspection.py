@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Union
 import pandas as pd
 
 class InspectionStrategy(ABC):
@@ -38,8 +39,9 @@ class DataTypesInspectionStrategy(InspectionStrategy):
             The DataFrame to inspect.
         """
         print("Datatypes and non-null count:\n")
-        # df.info() provides information about the DataFrame's columns, including data types and non-null values
-        print(df.info())
+        # df.info() prints the columns' data types and non-null counts itself and returns None;
+        # the memory usage footer is skipped as it is not part of this inspection
+        df.info(memory_usage=False)
 
 
 class SummaryStatisticsInspectionStrategy(InspectionStrategy):
@@ -63,6 +65,30 @@ class SummaryStatisticsInspectionStrategy(InspectionStrategy):
         print(df.describe())
 
 
+# Strategies are stateless, so one shared instance of each is looked up by name
+# instead of allocating a new strategy object for every inspection
+_STRATEGIES: dict[str, InspectionStrategy] = {
+    "data_types": DataTypesInspectionStrategy(),
+    "summary_statistics": SummaryStatisticsInspectionStrategy(),
+}
+
+
+def _resolve_strategy(strategy: Union[str, InspectionStrategy]) -> InspectionStrategy:
+    """
+    Returns the shared strategy instance registered under a name, or the strategy itself.
+
+    Parameters:
+    ----------
+    strategy : Union[str, InspectionStrategy]
+        A strategy instance or the name of a registered strategy.
+    """
+    if not isinstance(strategy, str):
+        return strategy
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Unsupported inspection strategy: {strategy}")
+    return _STRATEGIES[strategy]
+
+
 class PerformInspection:
     """
     Class to perform inspections on a DataFrame using a specified inspection strategy.
@@ -70,27 +96,28 @@ class PerformInspection:
     This class is responsible for executing the selected inspection strategy.
     """
 
-    def __init__(self, strategy: InspectionStrategy) -> None:
+    def __init__(self, strategy: Union[str, InspectionStrategy]) -> None:
         """
         Initializes the PerformInspection class with an inspection strategy.
 
         Parameters:
         ----------
-        strategy : InspectionStrategy
-            The initial inspection strategy to be used.
+        strategy : Union[str, InspectionStrategy]
+            The initial inspection strategy to be used, or the name of a registered
+            strategy ("data_types" or "summary_statistics").
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
 
-    def set_strategy(self, strategy: InspectionStrategy):
+    def set_strategy(self, strategy: Union[str, InspectionStrategy]):
         """
         Sets a new inspection strategy to be used for future inspections.
 
         Parameters:
         ----------
-        strategy : InspectionStrategy
-            The new inspection strategy to set.
+        strategy : Union[str, InspectionStrategy]
+            The new inspection strategy to set, or the name of a registered strategy.
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
 
     def execute_inspection(self, df: pd.DataFrame):
         """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Union
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
@@ -13,7 +14,7 @@ class BivariateAnalysisStrategy(ABC):
     """
 
     @abstractmethod
-    def plot(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def plot(self, df: pd.DataFrame, feature1: str, feature2: str, ax: Optional[plt.Axes] = None):
         """
         Plots the relationship between two features in the provided DataFrame.
         
@@ -21,6 +22,7 @@ class BivariateAnalysisStrategy(ABC):
         df (pd.DataFrame): The DataFrame containing the data.
         feature1 (str): The name of the first feature.
         feature2 (str): The name of the second feature.
+        ax (plt.Axes, optional): The axes to draw on; a new figure is created if None.
         """
         pass
 
@@ -30,22 +32,28 @@ class NumericalVsNumericalAnalysisStrategy(BivariateAnalysisStrategy):
     Concrete strategy for analyzing the relationship between two numerical features.
     """
 
-    def plot(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def plot(self, df: pd.DataFrame, feature1: str, feature2: str, ax: Optional[plt.Axes] = None):
         """
         Plots a scatter plot of two numerical features.
+
+        Frames with more than 10,000 rows are randomly sampled down to 10,000
+        points; beyond that, markers overlap at this figure size anyway.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data.
         feature1 (str): The name of the first numerical feature.
         feature2 (str): The name of the second numerical feature.
+        ax (plt.Axes, optional): The axes to draw on; a new figure is created if None.
         """
 
         print(f"Plotting scatter plot of {feature1} and {feature2}")
-        plt.figure(figsize=(10, 8))
-        sns.scatterplot(df[feature1], df[feature2])
-        plt.title(f"Scatterplot of {feature1} and {feature2}")
-        plt.xlabel(f"{feature1}")
-        plt.ylabel(f"{feature2}")
+        sample = df.sample(n=10_000, random_state=0) if len(df) > 10_000 else df
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 8))
+        sns.scatterplot(x=feature1, y=feature2, data=sample, ax=ax)
+        ax.set_title(f"Scatterplot of {feature1} and {feature2}")
+        ax.set_xlabel(f"{feature1}")
+        ax.set_ylabel(f"{feature2}")
         plt.show()
 
 
@@ -55,7 +63,7 @@ class NumericalVsCategoricalAnalysisStrategy(BivariateAnalysisStrategy):
     and a categorical feature.
     """
     
-    def plot(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def plot(self, df: pd.DataFrame, feature1: str, feature2: str, ax: Optional[plt.Axes] = None):
         """
         Plots a box plot of a numerical feature against a categorical feature.
         
@@ -63,37 +71,65 @@ class NumericalVsCategoricalAnalysisStrategy(BivariateAnalysisStrategy):
         df (pd.DataFrame): The DataFrame containing the data.
         feature1 (str): The name of the numerical feature.
         feature2 (str): The name of the categorical feature.
+        ax (plt.Axes, optional): The axes to draw on; a new figure is created if None.
         """
         print(f"Plotting box plot of {feature1} and {feature2}")
-        plt.figure(figsize=(10, 8))
-        sns.boxplot(df[feature1], df[feature2])
-        plt.title(f"Boxplot of {feature1} and {feature2}")
-        plt.xlabel(f"{feature1}")
-        plt.ylabel(f"{feature2}")
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 8))
+        sns.boxplot(x=feature2, y=feature1, data=df, ax=ax)
+        ax.set_title(f"Boxplot of {feature1} and {feature2}")
+        ax.set_xlabel(f"{feature2}")
+        ax.set_ylabel(f"{feature1}")
         plt.show()
 
+
+# Strategies are stateless, so one shared instance of each is looked up by name
+_STRATEGIES: dict[str, BivariateAnalysisStrategy] = {
+    "numerical_vs_numerical": NumericalVsNumericalAnalysisStrategy(),
+    "numerical_vs_categorical": NumericalVsCategoricalAnalysisStrategy(),
+}
+
+
+def _resolve_strategy(strategy: Union[str, BivariateAnalysisStrategy]) -> BivariateAnalysisStrategy:
+    """
+    Returns the shared strategy instance registered under a name, or the strategy itself.
+
+    Parameters:
+    strategy (Union[str, BivariateAnalysisStrategy]): A strategy or the name of a registered one.
+    """
+    if not isinstance(strategy, str):
+        return strategy
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Unsupported bivariate analysis strategy: {strategy}")
+    return _STRATEGIES[strategy]
+
+
 class BivariateAnalyzer:
     """
     Context class for performing bivariate analysis using a strategy.
     """
     
-    def __init__(self, strategy: BivariateAnalysisStrategy) -> None:
+    def __init__(self, strategy: Union[str, BivariateAnalysisStrategy]) -> None:
         """
         Initializes the BivariateAnalyzer with a specific strategy.
         
         Parameters:
-        strategy (BivariateAnalysisStrategy): The analysis strategy to use.
+        strategy (Union[str, BivariateAnalysisStrategy]): The analysis strategy to use, or the
+            name of a registered one ("numerical_vs_numerical" or "numerical_vs_categorical").
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
+        self._figure = None
+        self._ax = None
 
-    def set_strategy(self, strategy: BivariateAnalysisStrategy):
+    def set_strategy(self, strategy: Union[str, BivariateAnalysisStrategy]):
         """
         Sets a new analysis strategy.
         
         Parameters:
-        strategy (BivariateAnalysisStrategy): The new strategy to use.
+        strategy (Union[str, BivariateAnalysisStrategy]): The new strategy to use, or the name
+            of a registered one.
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
 
     def execute_analysis(self, df: pd.DataFrame, feature1: str, feature2: str):
         """
@@ -104,4 +140,17 @@ class BivariateAnalyzer:
         feature1 (str): The name of the first feature.
         feature2 (str): The name of the second feature.
         """
-        self._strategy.plot(df, feature1, feature2)
+        self._strategy.plot(df, feature1, feature2, ax=self._axes())
+
+    def _axes(self) -> plt.Axes:
+        """
+        Returns the analyzer's axes, cleared for a new plot.
+
+        One figure is reused across analyses instead of opening a new one per call;
+        it is only recreated once it has been closed (e.g. after being shown).
+        """
+        if self._figure is None or not plt.fignum_exists(self._figure.number):
+            self._figure, self._ax = plt.subplots(figsize=(10, 8))
+        else:
+            self._ax.clear()
+        return self._ax
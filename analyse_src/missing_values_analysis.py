@@ -1,9 +1,40 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+
+def _missing_counts(mask: np.ndarray) -> np.ndarray:
+    """
+    Counts the missing values in each column of a boolean missing-value mask.
+
+    Parameters:
+    mask (np.ndarray): 2D boolean array, True where a value is missing.
+
+    Returns:
+    np.ndarray: The number of missing values per column.
+    """
+    return np.count_nonzero(mask, axis=0)
+
+
+def _block_missing_fractions(mask: np.ndarray, step: int) -> np.ndarray:
+    """
+    Averages a boolean missing-value mask over consecutive blocks of rows.
+
+    Parameters:
+    mask (np.ndarray): 2D boolean array, True where a value is missing.
+    step (int): The number of rows per block; the last block may be shorter.
+
+    Returns:
+    np.ndarray: The fraction of missing values per block (rows) and column.
+    """
+    starts = np.arange(0, len(mask), step)
+    block_sizes = np.diff(np.append(starts, len(mask)))
+    return np.add.reduceat(mask, starts, axis=0, dtype=np.float32) / block_sizes[:, None]
+
+
 class MissingValuesAnalysisTemplate(ABC):
     """
     Abstract template for analyzing missing values in a DataFrame.
@@ -12,30 +43,36 @@ class MissingValuesAnalysisTemplate(ABC):
     def execute_analysis(self, df: pd.DataFrame):
         """
         Executes the analysis on the provided DataFrame.
+
+        The boolean missing-value mask is computed once here and shared by
+        both steps of the analysis.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
         """
-        self.identify_missing_values(df)
-        self.visualize_missing_values(df)
+        mask = df.isna()
+        self.identify_missing_values(df, mask)
+        self.visualize_missing_values(df, mask)
 
     @abstractmethod
-    def identify_missing_values(self, df: pd.DataFrame):
+    def identify_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame):
         """
         Identifies missing values in the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        mask (pd.DataFrame): Boolean DataFrame, True where a value is missing.
         """
         pass
 
     @abstractmethod
-    def visualize_missing_values(self, df: pd.DataFrame):
+    def visualize_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame):
         """
         Visualizes the missing values in the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to visualize.
+        mask (pd.DataFrame): Boolean DataFrame, True where a value is missing.
         """
         pass
     
@@ -48,26 +85,36 @@ class SimpleMissingValuesAnalysis(MissingValuesAnalysisTemplate):
     visualizing missing values in a DataFrame.
     """
 
-    def identify_missing_values(self, df: pd.DataFrame):
+    def identify_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame):
         """
         Identifies and prints the count of missing values for each column.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        mask (pd.DataFrame): Boolean DataFrame, True where a value is missing.
         """
         print("Count of missing values for each column")
-        missing_values = df.isnull().sum()
+        missing_values = pd.Series(_missing_counts(mask.to_numpy()), index=mask.columns)
         print(missing_values[missing_values > 0])
 
-    def visualize_missing_values(self, df: pd.DataFrame):
+    def visualize_missing_values(self, df: pd.DataFrame, mask: pd.DataFrame):
         """
         Visualizes the missing values in the DataFrame using a heatmap.
+
+        Frames taller than 2000 rows are block-averaged down to about 2000
+        rows first, so each heatmap cell shows the fraction of missing values
+        in its block of rows.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to visualize.
+        mask (pd.DataFrame): Boolean DataFrame, True where a value is missing.
         """
         print("Visualizing missing values in the dataset...")
+        step = max(1, len(mask) // 2000)
+        if step > 1:
+            block_means = _block_missing_fractions(mask.to_numpy(), step)
+            mask = pd.DataFrame(block_means, index=mask.index[::step], columns=mask.columns)
         plt.figure(figsize=(10, 8))
-        sns.heatmap(df.isna(), cbar=True, cmap="viridis")
+        sns.heatmap(mask, cbar=True, cmap="viridis", vmin=0, vmax=1)
         plt.title("Missing Values Heatmap")
         plt.show()
@@ -1,43 +1,98 @@
 from abc import ABC, abstractmethod
+import weakref
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
+
+def _correlation_matrix(numerical_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the Pearson correlation matrix of the numerical columns with np.corrcoef.
+
+    The columns are laid out as the rows of one contiguous float32 array, so np.corrcoef
+    standardizes them and forms the matrix in a single BLAS product instead of going
+    through pandas' pairwise loop. If any value is missing, the matrix is computed with
+    DataFrame.corr instead, which uses the pairwise-complete rows for each pair of columns.
+
+    Parameters:
+    numerical_df (pd.DataFrame): The numerical columns of the DataFrame to analyze.
+
+    Returns:
+    pd.DataFrame: The correlation matrix, indexed by the numerical column names.
+    """
+    values = np.ascontiguousarray(numerical_df.to_numpy(dtype=np.float32, na_value=np.nan).T)
+    if np.isnan(values).any():
+        return numerical_df.corr()
+    # Constant columns divide by a zero deviation and end up with NaN correlations, as in pandas
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = np.corrcoef(values, dtype=np.float32)
+    return pd.DataFrame(corr, index=numerical_df.columns, columns=numerical_df.columns)
+
 class MultivariateAnalysisTemplate(ABC):
     """
     Abstract template for multivariate analysis of a DataFrame.
     """
+
+    _num_df = None
+    _num_df_source = None
+    _num_df_columns = None
+
+    def numerical_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the numerical columns of the DataFrame.
+
+        The selection is cached for the last DataFrame seen, so the dtype scan and copy
+        done by select_dtypes happen once per DataFrame rather than once per plot. The
+        cache is rebuilt when a different DataFrame is passed or its columns change.
+        
+        Parameters:
+        df (pd.DataFrame): The DataFrame containing the data to analyze.
+
+        Returns:
+        pd.DataFrame: The numerical columns of df.
+        """
+        source = self._num_df_source() if self._num_df_source is not None else None
+        if source is not df or self._num_df_columns is not df.columns:
+            self._num_df = df.select_dtypes(include="number")
+            self._num_df_source = weakref.ref(df)
+            self._num_df_columns = df.columns
+        return self._num_df
     
     def execute_analysis(self, df: pd.DataFrame):
         """
         Executes the multivariate analysis on the provided DataFrame.
         
         This method orchestrates the plotting of a correlation heatmap and 
-        pairwise graphs by calling the respective methods.
+        pairwise graphs by calling the respective methods. The correlation
+        matrix is computed once here and handed to both steps.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
         """
-        self.plot_correlation_heatmap(df)
-        self.plot_pairwise_graphs(df)
+        corr = _correlation_matrix(self.numerical_df(df))
+        self.plot_correlation_heatmap(df, corr)
+        self.plot_pairwise_graphs(df, corr)
 
     @abstractmethod
-    def plot_correlation_heatmap(self, df: pd.DataFrame):
+    def plot_correlation_heatmap(self, df: pd.DataFrame, corr: pd.DataFrame):
         """
         Plots the correlation heatmap for the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        corr (pd.DataFrame): The correlation matrix of the numerical columns of df.
         """
         pass
 
     @abstractmethod
-    def plot_pairwise_graphs(self, df: pd.DataFrame):
+    def plot_pairwise_graphs(self, df: pd.DataFrame, corr: pd.DataFrame):
         """
         Plots pairwise graphs for the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        corr (pd.DataFrame): The correlation matrix of the numerical columns of df.
         """
         pass
 
@@ -50,28 +105,34 @@ class SimpleMultivariateAnalysis(MultivariateAnalysisTemplate):
     heatmap and pairwise graphs for a DataFrame.
     """
     
-    def plot_correlation_heatmap(self, df: pd.DataFrame):
+    def plot_correlation_heatmap(self, df: pd.DataFrame, corr: pd.DataFrame):
         """
         Plots the correlation heatmap of the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        corr (pd.DataFrame): The correlation matrix of the numerical columns of df.
         """
         print("Plotting correlation heatmap...")
         plt.figure(figsize=(10, 8))
-        sns.heatmap(df.corr())
+        sns.heatmap(corr)
         plt.title("Correlation heatmap")
         plt.show()
 
-    def plot_pairwise_graphs(self, df: pd.DataFrame):
+    def plot_pairwise_graphs(self, df: pd.DataFrame, corr: pd.DataFrame):
         """
-        Plots pairwise graphs of the DataFrame.
+        Plots pairwise graphs of the columns in the correlation matrix.
+
+        At most 2000 rows are sampled, since a scatter grid over every row
+        costs far more to draw than it adds visually.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data to analyze.
+        corr (pd.DataFrame): The correlation matrix of the numerical columns of df.
         """
         print("Plotting pairwise plots...")
-        plt.figure(figsize=(10, 8))
-        sns.pairplot(df.corr())  
-        plt.title("Correlation heatmap") 
+        numerical_df = self.numerical_df(df)
+        sample = numerical_df.sample(n=min(len(numerical_df), 2000), random_state=0)
+        grid = sns.pairplot(sample, vars=list(corr.columns))
+        grid.figure.suptitle("Pairwise plots", y=1.02)
         plt.show()
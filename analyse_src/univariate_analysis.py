@@ -1,21 +1,135 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional, Union
+import os
+import weakref
+from joblib import Parallel, delayed
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# matplotlib, seaborn and scipy are only imported once something is actually plotted,
+# so importing this module stays cheap for code that never visualizes anything
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+def _pyplot():
+    """
+    Imports and returns matplotlib.pyplot on first use.
+
+    When the HEADLESS environment variable is set, the non-interactive Agg backend
+    is selected before pyplot is imported, skipping GUI backend discovery.
+    """
+    import matplotlib
+    if os.environ.get("HEADLESS"):
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Non-missing values per feature of every DataFrame visualized so far, keyed by id(df).
+# An entry is dropped as soon as its DataFrame is garbage collected, so a recycled id
+# can never serve another frame's values.
+_CLEAN_VALUES: dict[int, dict[str, np.ndarray]] = {}
+
+
+def _clean_values(df: pd.DataFrame, feature: str) -> np.ndarray:
+    """
+    Returns the non-missing values of a feature as a float array, cached per DataFrame.
+
+    Repeated plots of the same feature, as is common in a notebook session, reuse the
+    cached array instead of rescanning the column. The DataFrame is assumed not to be
+    modified in place between calls.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing the data.
+    feature (str): The name of the numerical feature.
+
+    Returns:
+    np.ndarray: The feature's values with missing entries removed.
+    """
+    key = id(df)
+    if key not in _CLEAN_VALUES:
+        _CLEAN_VALUES[key] = {}
+        weakref.finalize(df, _CLEAN_VALUES.pop, key, None)
+    cached = _CLEAN_VALUES[key]
+    if feature not in cached:
+        cached[feature] = df[feature].dropna().to_numpy(dtype=float)
+    return cached[feature]
+
+
+def _fft_kde(values: np.ndarray, lower: float, upper: float, gridsize: int = 512) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Estimates a Gaussian KDE of the values on an even grid using an FFT convolution.
+
+    The values are binned onto the grid and the bin counts are convolved with a
+    sampled Gaussian kernel, which costs O(G log G) for G grid points instead of the
+    O(N * G) of evaluating every kernel at every grid point. The bandwidth follows
+    Scott's rule, as in scipy.stats.gaussian_kde.
+
+    Parameters:
+    values (np.ndarray): The values to estimate the density of, all within [lower, upper].
+    lower (float): The start of the evaluation grid.
+    upper (float): The end of the evaluation grid.
+    gridsize (int): The number of grid points.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The grid and the estimated density on it.
+    """
+    grid, step = np.linspace(lower, upper, gridsize, retstep=True)
+    bandwidth = values.std(ddof=1) * values.size ** (-1 / 5)
+    binned = np.bincount(np.rint((values - lower) / step).astype(np.intp), minlength=gridsize)
+    # Kernel is truncated at four bandwidths either side, or at the grid's width
+    half_width = min(int(np.ceil(4 * bandwidth / step)), gridsize)
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    from scipy.signal import fftconvolve
+
+    density = fftconvolve(binned, kernel, mode="same") / values.size
+    return grid, np.clip(density, 0, None)
+
 
 class UnivariateAnalysisStrategy(ABC):
     """
     Abstract base class for univariate analysis strategies.
+
+    Visualizing a feature is split into computing the data to plot, which only
+    touches pandas/NumPy and may run off the main thread, and drawing it, which
+    must stay on the main thread.
     """
 
-    @abstractmethod
-    def visualize(self, df: pd.DataFrame, feature: str):
+    def visualize(self, df: pd.DataFrame, feature: str, ax: Optional["Axes"] = None):
         """
         Visualizes a specified feature from the DataFrame.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data.
         feature (str): The name of the feature to visualize.
+        ax (Axes, optional): The axes to draw on; a new figure is created if None.
+        """
+        self.plot(self.compute(df, feature), feature, ax=ax)
+
+    @abstractmethod
+    def compute(self, df: pd.DataFrame, feature: str) -> Any:
+        """
+        Computes the data needed to plot a specified feature.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame containing the data.
+        feature (str): The name of the feature to visualize.
+
+        Returns:
+        Any: The plot data, passed unchanged to plot.
+        """
+        pass
+
+    @abstractmethod
+    def plot(self, data: Any, feature: str, ax: Optional["Axes"] = None):
+        """
+        Draws the plot data computed for a feature.
+
+        Parameters:
+        data (Any): The plot data returned by compute.
+        feature (str): The name of the feature to visualize.
+        ax (Axes, optional): The axes to draw on; a new figure is created if None.
         """
         pass
 
@@ -28,18 +142,50 @@ class NumericalFeatureAnalysis(UnivariateAnalysisStrategy):
     histograms.
     """
 
-    def visualize(self, df: pd.DataFrame, feature: str):
+    def compute(self, df: pd.DataFrame, feature: str) -> tuple:
         """
-        Visualizes a numerical feature using a histogram with a KDE overlay.
+        Computes the histogram and KDE curve of a numerical feature.
+
+        The histogram is binned with NumPy and the KDE is estimated on a fixed
+        grid by FFT convolution, scaled to the histogram's count axis.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data.
         feature (str): The name of the numerical feature to visualize.
+
+        Returns:
+        tuple: The histogram counts and bin edges, and the KDE grid and curve
+            (both None when no KDE can be estimated).
+        """
+        values = _clean_values(df, feature)
+        counts, edges = np.histogram(values, bins=30)
+        grid, curve = None, None
+        # A KDE needs at least two distinct values to estimate a bandwidth
+        if values.size > 1 and np.ptp(values) > 0:
+            grid, density = _fft_kde(values, edges[0], edges[-1])
+            curve = density * values.size * (edges[1] - edges[0])
+        return counts, edges, grid, curve
+
+    def plot(self, data: tuple, feature: str, ax: Optional["Axes"] = None):
+        """
+        Visualizes a numerical feature using a histogram with a KDE overlay.
+
+        Parameters:
+        data (tuple): The histogram and KDE data returned by compute.
+        feature (str): The name of the numerical feature to visualize.
+        ax (Axes, optional): The axes to draw on; a new figure is created if None.
         """
         print(f"Visualizing feature: {feature}")
-        plt.figure(figsize=(10, 8))
-        sns.histplot(df[feature], bins=30, kde=True)
-        plt.title(f"Histogram of {feature}")
+        counts, edges, grid, curve = data
+        plt = _pyplot()
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 8))
+        ax.stairs(counts, edges, fill=True, alpha=0.5)
+        if curve is not None:
+            ax.plot(grid, curve)
+        ax.set_title(f"Histogram of {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("count")
         plt.show()
 
 
@@ -51,42 +197,90 @@ class CategoricalFeatureAnalysis(UnivariateAnalysisStrategy):
     count plots.
     """
 
-    def visualize(self, df: pd.DataFrame, feature: str):
+    def compute(self, df: pd.DataFrame, feature: str) -> pd.Series:
         """
-        Visualizes a categorical feature using a count plot.
+        Counts the occurrences of each category of a categorical feature.
+
+        The counts are taken from the feature's categorical codes rather than
+        by hashing every raw value.
         
         Parameters:
         df (pd.DataFrame): The DataFrame containing the data.
         feature (str): The name of the categorical feature to visualize.
+
+        Returns:
+        pd.Series: The count of each category, indexed by category.
+        """
+        return df[feature].astype("category").value_counts(sort=False)
+
+    def plot(self, counts: pd.Series, feature: str, ax: Optional["Axes"] = None):
+        """
+        Visualizes a categorical feature using a count plot.
+
+        Parameters:
+        counts (pd.Series): The category counts returned by compute.
+        feature (str): The name of the categorical feature to visualize.
+        ax (Axes, optional): The axes to draw on; a new figure is created if None.
         """
-        plt.figure(figsize=(10, 8))
-        sns.countplot(df[feature])
-        plt.title(f"Countplot of {feature}")
+        import seaborn as sns
+
+        plt = _pyplot()
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 8))
+        sns.barplot(x=counts.index, y=counts.to_numpy(), ax=ax)
+        ax.set_title(f"Countplot of {feature}")
+        ax.set_xlabel(feature)
+        ax.set_ylabel("count")
         plt.show()
 
 
+# Strategies are stateless, so one shared instance of each is looked up by name
+_STRATEGIES: dict[str, UnivariateAnalysisStrategy] = {
+    "numerical": NumericalFeatureAnalysis(),
+    "categorical": CategoricalFeatureAnalysis(),
+}
+
+
+def _resolve_strategy(strategy: Union[str, UnivariateAnalysisStrategy]) -> UnivariateAnalysisStrategy:
+    """
+    Returns the shared strategy instance registered under a name, or the strategy itself.
+
+    Parameters:
+    strategy (Union[str, UnivariateAnalysisStrategy]): A strategy or the name of a registered one.
+    """
+    if not isinstance(strategy, str):
+        return strategy
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Unsupported univariate analysis strategy: {strategy}")
+    return _STRATEGIES[strategy]
+
+
 class UnivariateAnalysis:
     """
     Context class for performing univariate analysis using a strategy.
     """
 
-    def __init__(self, strategy: UnivariateAnalysisStrategy):
+    def __init__(self, strategy: Union[str, UnivariateAnalysisStrategy]):
         """
         Initializes the UnivariateAnalysis with a specific strategy.
         
         Parameters:
-        strategy (UnivariateAnalysisStrategy): The analysis strategy to use.
+        strategy (Union[str, UnivariateAnalysisStrategy]): The analysis strategy to use,
+            or the name of a registered one ("numerical" or "categorical").
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
+        self._figure = None
+        self._ax = None
 
-    def set_strategy(self, strategy: UnivariateAnalysisStrategy):
+    def set_strategy(self, strategy: Union[str, UnivariateAnalysisStrategy]):
         """
         Sets a new analysis strategy.
         
         Parameters:
-        strategy (UnivariateAnalysisStrategy): The new strategy to use.
+        strategy (Union[str, UnivariateAnalysisStrategy]): The new strategy to use,
+            or the name of a registered one.
         """
-        self._strategy = strategy
+        self._strategy = _resolve_strategy(strategy)
 
     def execute_analysis(self, df: pd.DataFrame, feature: str):
         """
@@ -96,4 +290,37 @@ class UnivariateAnalysis:
         df (pd.DataFrame): The DataFrame containing the data.
         feature (str): The name of the feature to visualize.
         """
-        self._strategy.visualize(df, feature)
+        self._strategy.visualize(df, feature, ax=self._axes())
+
+    def analyze_all(self, df: pd.DataFrame, features: list[str], n_jobs: int = -1):
+        """
+        Executes the analysis for several features using the currently set strategy.
+
+        The plot data of all features is computed in parallel threads, since the
+        underlying pandas/NumPy work releases the GIL; the plots are then drawn
+        one by one on the calling thread.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame containing the data.
+        features (list[str]): The names of the features to visualize.
+        n_jobs (int): The number of threads to compute with (default is -1, all cores).
+        """
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(self._strategy.compute)(df, feature) for feature in features
+        )
+        for feature, data in zip(features, results):
+            self._strategy.plot(data, feature, ax=self._axes())
+
+    def _axes(self) -> "Axes":
+        """
+        Returns the analysis' axes, cleared for a new plot.
+
+        One figure is reused across analyses instead of opening a new one per call;
+        it is only recreated once it has been closed (e.g. after being shown).
+        """
+        plt = _pyplot()
+        if self._figure is None or not plt.fignum_exists(self._figure.number):
+            self._figure, self._ax = plt.subplots(figsize=(10, 8))
+        else:
+            self._ax.clear()
+        return self._ax
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from zipfile import ZipFile
-import os
 from pathlib import Path
 import pandas as pd
 
@@ -30,7 +29,9 @@ class ZipDataExtractor(DataExtractor):
     
     def extract(self, file_path: str) -> pd.DataFrame:
         """
-        Extracts a CSV file from a zip file and returns it as a DataFrame.
+        Reads the CSV file contained in a zip file and returns it as a DataFrame.
+
+        The CSV is streamed straight out of the archive, nothing is written to disk.
         
         Parameters:
         file_path (str): The path to the zip file.
@@ -42,27 +43,28 @@ class ZipDataExtractor(DataExtractor):
         if not file_path.endswith(".zip"):
             raise ValueError(f"Provided filepath doesn't contain a zip file")
         
-        # Extract the contents of the zip file to a specified folder
         with ZipFile(file_path, "r") as zip_ref:
-            extracted_folder_path = Path(__file__).parent.parent / "extracted_data"
-            zip_ref.extractall(extracted_folder_path)
-
-        # List files in the extracted directory and filter for CSV files
-        files = os.listdir(extracted_folder_path)
-        csv_files = [file for file in files if file.endswith(".csv")]
+            # Filter the archive members for CSV files
+            csv_files = [name for name in zip_ref.namelist() if name.endswith(".csv")]
 
-        # Handle cases for found CSV files
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No CSV file found in the extracted data.")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found.")
+            # Handle cases for found CSV files
+            if len(csv_files) == 0:
+                raise FileNotFoundError("No CSV file found in the zip file.")
+            if len(csv_files) > 1:
+                raise ValueError("Multiple CSV files found.")
 
-        # Read the single CSV file into a DataFrame
-        csv_file_path = extracted_folder_path / csv_files[0]
-        df = pd.read_csv(csv_file_path)
+            # Read the single CSV file into a DataFrame directly from the archive
+            with zip_ref.open(csv_files[0]) as csv_file:
+                df = pd.read_csv(csv_file)
         return df
         
 
+# Maps each supported file extension to its extractor; extractors hold no state, so one instance is shared
+_EXTRACTORS: dict[str, DataExtractor] = {
+    "zip": ZipDataExtractor(),
+}
+
+
 class DataExtractionFactory:
     """
     Factory class for creating data extractors based on file extension.
@@ -79,10 +81,10 @@ class DataExtractionFactory:
         Returns:
         DataExtractor: An instance of the appropriate data extractor.
         """
-        if file_extension == "zip":
-            return ZipDataExtractor()
-        else:
-            raise ValueError(f"No extractor available for file extension: {file_extension}")
+        try:
+            return _EXTRACTORS[file_extension]
+        except KeyError:
+            raise ValueError(f"No extractor available for file extension: {file_extension}") from None
         
 
 if __name__ == "__main__":
@@ -37,22 +37,24 @@ class Latte(Coffee):
         return f"Making latte for {self}"
     
 
+# Maps each coffee type name to the class that makes it
+_REGISTRY: dict[str, type[Coffee]] = {
+    "Espresso": Espresso,
+    "Cappucino": Cappucino,
+    "Latte": Latte,
+}
+
+
 class CoffeeMachine:
     """
     hjjkdjkmkdmc
     """
     def get_coffee(self, coffee_type: str):
-        if coffee_type == "Espresso":
-            return Espresso().make_coffee()
-
-        elif coffee_type == "Cappucino":
-            return Cappucino().make_coffee()
-        
-        elif coffee_type == "Latte":
-            return Latte().make_coffee()
-
-        else:
-            raise ValueError("Invalid coffee type")
+        try:
+            coffee_class = _REGISTRY[coffee_type]
+        except KeyError:
+            raise ValueError("Invalid coffee type") from None
+        return coffee_class().make_coffee()
 
 
 if __name__=="__main__":
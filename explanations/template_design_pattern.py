@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
+import sys
 
 class DiningExperience(ABC):
 
     def serve_dinner(self):
-        self.serve_appetizer()
-        self.serve_main_course()
-        self.serve_dessert()
-        self.serve_beverage()
+        # Each hook returns its line; the whole dinner is written out in one go
+        courses = [
+            self.serve_appetizer(),
+            self.serve_main_course(),
+            self.serve_dessert(),
+            self.serve_beverage(),
+        ]
+        sys.stdout.write("\n".join(courses) + "\n")
 
     
     @abstractmethod
@@ -29,27 +34,27 @@ class DiningExperience(ABC):
 class ItalianDinner(DiningExperience):
 
     def serve_appetizer(self):
-        print("Serving bruschetta as appetizer")
+        return "Serving bruschetta as appetizer"
         
     def serve_main_course(self):
-        print("Serving pasta as the main course")
+        return "Serving pasta as the main course"
 
     def serve_dessert(self):
-        print("Serving tiramisu as dessert")
+        return "Serving tiramisu as dessert"
         
     def serve_beverage(self):
-        print("Serving wine as the beverage")
+        return "Serving wine as the beverage"
 
 
 class ChineseDinner(DiningExperience):
     def serve_appetizer(self):
-        print("Serving spring rolls as appetizer")
+        return "Serving spring rolls as appetizer"
         
     def serve_main_course(self):
-        print("Serving stir-fried noodles as main course")
+        return "Serving stir-fried noodles as main course"
     
     def serve_dessert(self):
-        print("Serving fortune cookies as dessert")
+        return "Serving fortune cookies as dessert"
 
     def serve_beverage(self):
-        print("Serving tea as beverage")
\ No newline at end of file
+        return "Serving tea as beverage"
\ No newline at end of file
@@ -1,5 +1,8 @@
+import math
 import pandas as pd
+from typing import Optional
 from sklearn.model_selection import train_test_split
+from sklearn.utils import check_random_state
 import logging
 from pathlib import Path
 
@@ -11,9 +14,9 @@ class DataSplitter:
     A class used to handle train-test splitting of a dataset.
     """
     
-    def __init__(self, test_size: float = 0.2, random_state: int = 42) -> None:
+    def __init__(self, test_size: float = 0.2, random_state: int = 42, shuffle: bool = True, stratify: Optional[str] = None) -> None:
         """
-        Initializes the DataSplitter with test size and random state.
+        Initializes the DataSplitter with test size, random state and shuffling options.
 
         Parameters:
         ----------
@@ -21,9 +24,19 @@ class DataSplitter:
             Proportion of the dataset to be used for testing (default is 0.2).
         random_state : int, optional
             Random seed for shuffling data before splitting (default is 42).
+        shuffle : bool, optional
+            Whether to shuffle the data before splitting (default is True). Pass False when the data is
+            already in random order; the rows are then split by position without any random permutation.
+        stratify : str, optional
+            Name of the column whose class proportions are preserved in both sets (default is None).
+            Requires shuffle=True.
         """
+        if stratify is not None and not shuffle:
+            raise ValueError("Stratified train test split requires shuffle=True.")
         self.test_size = test_size
         self.random_state = random_state
+        self.shuffle = shuffle
+        self.stratify = stratify
 
     def split_data(self, df: pd.DataFrame, target_variable: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
         """
@@ -45,13 +58,33 @@ class DataSplitter:
             - y_train : Training set target variable (Series)
             - y_test : Testing set target variable (Series)
         """
-        # Split the dataframe into features (X) and target (y)
-        X = df.drop(target_variable, axis=1)
-        y = df[target_variable]
+        # Size the test set like train_test_split does: an absolute count, or a rounded-up fraction
+        n_test = self.test_size if isinstance(self.test_size, int) else math.ceil(self.test_size * len(df))
 
-        # Perform train-test split
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=self.test_size, random_state=self.random_state)
+        if self.stratify is not None:
+            # Perform stratified train-test split
+            X = df.drop(target_variable, axis=1)
+            y = df[target_variable]
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=self.test_size, random_state=self.random_state, shuffle=True, stratify=df[self.stratify]
+            )
+        else:
+            if self.shuffle:
+                # Draw the same permutation as train_test_split, then take each set's rows from the
+                # whole frame in one go instead of indexing features and target separately
+                permutation = check_random_state(self.random_state).permutation(len(df))
+                train_df, test_df = df.take(permutation[n_test:]), df.take(permutation[:n_test])
+            else:
+                # Data is already shuffled: slice by position
+                split = len(df) - n_test
+                train_df, test_df = df.iloc[:split].copy(), df.iloc[split:].copy()
+
+            # Split each set into features (X) and target (y); pop removes the target column in place
+            y_train, y_test = train_df.pop(target_variable), test_df.pop(target_variable)
+            X_train, X_test = train_df, test_df
 
         # Log the completion of the split and the shapes of the resulting datasets
         logging.info("Train test split completed.")
-        logging.info(f"Shapes of x train test, y train test : {X_train.shape}, {X_test.shape}, {y_train.shape}")
+        logging.info("Shapes of x train test, y train test : %s, %s, %s, %s", X_train.shape, X_test.shape, y_train.shape, y_test.shape)
+        return X_train, X_test, y_train, y_test
+
@@ -1,25 +1,69 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 import logging
+import joblib
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, OneHotEncoder
 
 # Configure logging to display messages with timestamps and logging levels
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def _float32_block(df: pd.DataFrame, features: list[str]) -> np.ndarray:
+    """
+    Extracts the specified features as a C-contiguous float32 array.
+
+    Handing sklearn's scalers an array that already has a float dtype and a contiguous layout lets
+    their input validation use it as is instead of making its own float64 copy.
+
+    Parameters:
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    features : list of str
+        The features to extract.
+
+    Returns:
+    -------
+    np.ndarray
+        A fresh (n_rows, n_features) float32 array, safe to modify in place.
+    """
+    return np.ascontiguousarray(df[features].to_numpy(dtype=np.float32))
+
+
 # Abstract class 
 class FeatureEngineeringStrategy(ABC):
     """
     Abstract base class for feature engineering strategies.
 
-    All feature engineering strategies must implement the apply_transformation method.
+    All feature engineering strategies must implement the transform method. Strategies that learn
+    parameters from the data (scalers, encoders) also override fit, so that a strategy fitted once
+    can be saved and reused to transform new data without fitting again.
     """
-    
+
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Learns the transformation's parameters from a given DataFrame.
+
+        Stateless transformations have nothing to learn, so the default does nothing.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to fit the transformation on.
+
+        Returns:
+        -------
+        FeatureEngineeringStrategy
+            The fitted strategy itself.
+        """
+        return self
+
     @abstractmethod
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Abstract method to apply a transformation on a given DataFrame.
+        Abstract method to apply an already fitted transformation on a given DataFrame.
 
         Parameters:
         ----------
@@ -33,6 +77,53 @@ class FeatureEngineeringStrategy(ABC):
         """
         pass
 
+    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits the transformation on a given DataFrame and applies it to the same DataFrame.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to apply the transformation to.
+
+        Returns:
+        -------
+        pd.DataFrame
+            The transformed DataFrame.
+        """
+        return self.fit(df).transform(df)
+
+    def save(self, path: str):
+        """
+        Persists the (fitted) strategy to disk with joblib.
+
+        Parameters:
+        ----------
+        path : str
+            The file to write the strategy to.
+        """
+        joblib.dump(self, path)
+        logging.info("Saved %s to %s.", type(self).__name__, path)
+
+    @staticmethod
+    def load(path: str) -> "FeatureEngineeringStrategy":
+        """
+        Loads a strategy previously persisted with save.
+
+        Parameters:
+        ----------
+        path : str
+            The file to read the strategy from.
+
+        Returns:
+        -------
+        FeatureEngineeringStrategy
+            The loaded strategy, ready to transform new data.
+        """
+        strategy = joblib.load(path)
+        logging.info("Loaded %s from %s.", type(strategy).__name__, path)
+        return strategy
+
 
 # Define concrete classes 
 class LogTransformationStrategy(FeatureEngineeringStrategy):
@@ -40,7 +131,10 @@ class LogTransformationStrategy(FeatureEngineeringStrategy):
     Feature engineering strategy to apply logarithmic transformation to specified features.
     """
     
-    def __init__(self, features: list[str]) -> None:
+    # Below this many values, a single-threaded pass is faster than dispatching to threads
+    parallel_threshold = 1_000_000
+
+    def __init__(self, features: list[str], n_jobs: int = -1) -> None:
         """
         Initializes the LogTransformationStrategy with the features to be transformed.
 
@@ -48,10 +142,13 @@ class LogTransformationStrategy(FeatureEngineeringStrategy):
         ----------
         features : list of str
             The features in the DataFrame on which to apply the log transformation.
+        n_jobs : int, optional
+            The number of threads used to transform large DataFrames (default is -1, all cores).
         """
         self.features = features
+        self.n_jobs = n_jobs
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Applies the log transformation to the specified features in the DataFrame.
 
@@ -65,14 +162,21 @@ class LogTransformationStrategy(FeatureEngineeringStrategy):
         pd.DataFrame
             The DataFrame with log-transformed features.
         """
-        logging.info(f"Applying log transformation on features: {self.features}")
+        logging.info("Applying log transformation on features: %s", self.features)
         
-        # Create a copy of the DataFrame to avoid modifying the original data
-        df_transformed = df.copy()
+        # Shallow copy: only the reassigned columns get new data, the original DataFrame is left untouched
+        df_transformed = df.copy(deep=False)
         
-        # Apply log1p (log(1 + x)) transformation on each specified feature
-        for feature in self.features:
-            df_transformed[feature] = np.log1p(df[feature])
+        # Apply log1p (log(1 + x)) to all specified features in one vectorized pass,
+        # writing the result in place over the extracted block
+        values = df[self.features].to_numpy(dtype=np.float64)
+        if values.size < self.parallel_threshold or self.n_jobs == 1:
+            np.log1p(values, out=values)
+        else:
+            # np.log1p releases the GIL, so row chunks of the block are transformed concurrently in threads
+            chunks = np.array_split(values, joblib.effective_n_jobs(self.n_jobs))
+            Parallel(n_jobs=self.n_jobs, prefer="threads")(delayed(np.log1p)(chunk, out=chunk) for chunk in chunks)
+        df_transformed[self.features] = values
 
         logging.info("Log transformation completed.")
         return df_transformed
@@ -93,11 +197,29 @@ class StandardScalingStrategy(FeatureEngineeringStrategy):
             The features in the DataFrame to be scaled using standard scaling.
         """
         self.features = features
-        self.scaler = StandardScaler()
+        # The scaler gets a fresh float32 array on every call, so it may scale it in place
+        self.scaler = StandardScaler(copy=False)
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame) -> "StandardScalingStrategy":
+        """
+        Learns the mean and standard deviation of the specified features.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to fit the scaler on.
+
+        Returns:
+        -------
+        StandardScalingStrategy
+            The fitted strategy itself.
+        """
+        self.scaler.fit(_float32_block(df, self.features))
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Applies standard scaling to the specified features in the DataFrame.
+        Applies the fitted standard scaling to the specified features in the DataFrame.
 
         Parameters:
         ----------
@@ -109,13 +231,13 @@ class StandardScalingStrategy(FeatureEngineeringStrategy):
         pd.DataFrame
             The DataFrame with standardized features.
         """
-        logging.info(f"Applying standard scaler transformation on features: {self.features}")
+        logging.info("Applying standard scaler transformation on features: %s", self.features)
         
-        # Create a copy of the DataFrame to avoid modifying the original data
-        df_transformed = df.copy()
+        # Shallow copy: only the reassigned columns get new data, the original DataFrame is left untouched
+        df_transformed = df.copy(deep=False)
         
         # Apply standard scaling to the specified features
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed[self.features] = self.scaler.transform(_float32_block(df, self.features))
         
         logging.info("Standard scaler transformation completed.")
         return df_transformed
@@ -139,11 +261,29 @@ class MinMaxScalingStrategy(FeatureEngineeringStrategy):
             The range to which the features will be scaled (default is (0, 1)).
         """
         self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
+        # The scaler gets a fresh float32 array on every call, so it may scale it in place
+        self.scaler = MinMaxScaler(feature_range=feature_range, copy=False)
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame) -> "MinMaxScalingStrategy":
+        """
+        Learns the minimum and maximum of the specified features.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to fit the scaler on.
+
+        Returns:
+        -------
+        MinMaxScalingStrategy
+            The fitted strategy itself.
         """
-        Applies Min-Max scaling to the specified features in the DataFrame.
+        self.scaler.fit(_float32_block(df, self.features))
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted Min-Max scaling to the specified features in the DataFrame.
 
         Parameters:
         ----------
@@ -155,13 +295,13 @@ class MinMaxScalingStrategy(FeatureEngineeringStrategy):
         pd.DataFrame
             The DataFrame with scaled features.
         """
-        logging.info(f"Applying Min-Max scaling to features: {self.features}")
+        logging.info("Applying Min-Max scaling to features: %s", self.features)
         
-        # Create a copy of the DataFrame to avoid modifying the original data
-        df_transformed = df.copy()
+        # Shallow copy: only the reassigned columns get new data, the original DataFrame is left untouched
+        df_transformed = df.copy(deep=False)
         
         # Apply Min-Max scaling to the specified features
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed[self.features] = self.scaler.transform(_float32_block(df, self.features))
         
         logging.info("Min-Max transformation completed.")
         return df_transformed
@@ -182,11 +322,32 @@ class OneHotEncodingStrategy(FeatureEngineeringStrategy):
             The categorical features in the DataFrame to be one-hot encoded.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        # Categories unseen during fit are encoded as all zeros instead of failing the transform. No category
+        # is dropped, since with a dropped first category its rows would be all zeros too and look unseen
+        self.encoder = OneHotEncoder(sparse_output=True, handle_unknown="ignore", dtype=np.float32)
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame) -> "OneHotEncodingStrategy":
         """
-        Applies one-hot encoding to the specified categorical features in the DataFrame.
+        Learns the categories of the specified features.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to fit the encoder on.
+
+        Returns:
+        -------
+        OneHotEncodingStrategy
+            The fitted strategy itself.
+        """
+        self.encoder.fit(df[self.features])
+        # Output column names only depend on the fitted categories, so they are built once here
+        self._feature_names = self.encoder.get_feature_names_out(self.features)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted one-hot encoding to the specified categorical features in the DataFrame.
 
         Parameters:
         ----------
@@ -198,22 +359,21 @@ class OneHotEncodingStrategy(FeatureEngineeringStrategy):
         pd.DataFrame
             The DataFrame with the original features replaced by their encoded versions.
         """
-        logging.info(f"Applying one-hot encoding on features: {self.features}")
-        
-        # Create a copy of the DataFrame to avoid modifying the original data
-        df_transformed = df.copy()
+        logging.info("Applying one-hot encoding on features: %s", self.features)
         
-        # Perform one-hot encoding on the specified features and store the result as a DataFrame
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features)
+        # Perform one-hot encoding on the specified features and keep the mostly-zero result sparse,
+        # aligned on the input's index so that the concatenation below matches rows up correctly
+        encoded_df = pd.DataFrame.sparse.from_spmatrix(
+            self.encoder.transform(df[self.features]),
+            index=df.index,
+            columns=self._feature_names
         )
         
         # Drop the original categorical columns from the DataFrame
-        df_transformed = df_transformed.drop(columns=self.features)
+        df_transformed = df.drop(columns=self.features)
         
-        # Concatenate the encoded features with the remaining original features
-        df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
+        # Concatenate the encoded features with the remaining original features without copying them again
+        df_transformed = pd.concat([df_transformed, encoded_df], axis=1, copy=False)
         
         logging.info("One-hot encoding completed.")
         return df_transformed
@@ -266,4 +426,21 @@ class FeatureEngineer:
         # Apply the selected strategy's transformation to the DataFrame
         return self._strategy.apply_transformation(df)
 
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the current, already fitted, feature engineering strategy to the given DataFrame without refitting it.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The input DataFrame to which the feature engineering strategy will be applied.
+
+        Returns:
+        -------
+        pd.DataFrame
+            The transformed DataFrame after applying the feature engineering strategy.
+        """
+        logging.info("Applying fitted feature engineering strategy.")
+        return self._strategy.transform(df)
+
     
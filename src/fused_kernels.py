@@ -0,0 +1,38 @@
+import numpy as np
+from typing import Union
+
+
+def log1p_zscore_mask(x: np.ndarray, k: Union[int, float] = 3) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Applies log1p to the values and flags the rows whose Z-score stays within the threshold.
+
+    The log transformation and the Z-score outlier detection share one function call and one log1p
+    array: the log is taken once, the column means and standard deviations are computed from it, and
+    the outlier test compares |y - mean| against k * std, so the Z-scores themselves are never
+    materialized. These are still separate NumPy passes over the data. The statistics match pandas'
+    (NaNs are skipped and the standard deviation uses ddof=1), and missing values are never flagged
+    as outliers.
+
+    Parameters:
+    ----------
+    x : np.ndarray
+        A 1D array of values, or a 2D array with one column per feature.
+    k : Union[int, float], default=3
+        The Z-score threshold for identifying outliers.
+
+    Returns:
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The log1p-transformed values (float64, same shape as x) and a boolean array with one entry
+        per row that is True where no feature's absolute Z-score exceeds k.
+    """
+    y = np.log1p(np.asarray(x, dtype=np.float64))
+    mean = np.nanmean(y, axis=0)
+    std = np.nanstd(y, axis=0, ddof=1)
+
+    # |y - mean| > k * std is the same test as |z| > k without materializing the Z-scores
+    with np.errstate(invalid="ignore"):
+        outliers = np.abs(y - mean) > k * std
+    if outliers.ndim > 1:
+        outliers = outliers.any(axis=1)
+    return y, ~outliers
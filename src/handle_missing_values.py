@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 import logging
-from typing import Union
+import warnings
+from typing import Callable, Union
 
 # Configure logging to display the time, log level, and message
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -66,7 +68,13 @@ class DropMissingValuesStrategy(MissingValuesHandlingStrategy):
         pd.DataFrame
             The DataFrame after dropping missing values.
         """
-        logging.info(f"Dropping missing values with axis={self.axis} and threshold={self.thresh}.")
+        # Nothing can be dropped from a frame without missing values, so return it as is
+        # rather than letting dropna allocate an identical copy
+        if not df.isna().to_numpy().any():
+            logging.info("No missing values present; skipping drop.")
+            return df
+
+        logging.info("Dropping missing values with axis=%s and threshold=%s.", self.axis, self.thresh)
         
         # Drop missing values from rows or columns based on the axis and threshold
         df_cleaned = df.dropna(axis=self.axis, thresh=self.thresh)
@@ -80,9 +88,9 @@ class FillMissingValuesStrategy(MissingValuesHandlingStrategy):
     Strategy to fill missing values in the DataFrame with specified methods or constants.
     """
     
-    def __init__(self, method: str = "mean", fill_value: Union[str, int, float] = None) -> None:
+    def __init__(self, method: str = "mean", fill_value: Union[str, int, float] = None, inplace: bool = False) -> None:
         """
-        Initializes the fill strategy with the method and fill value.
+        Initializes the fill strategy with the method, fill value and whether to fill in place.
 
         Parameters:
         ----------
@@ -90,9 +98,12 @@ class FillMissingValuesStrategy(MissingValuesHandlingStrategy):
             The method to fill missing values ('mean', 'median', 'mode', 'constant') (default is 'mean').
         fill_value : Union[str, int, float], optional
             The value to use when filling missing values with the 'constant' method (default is None).
+        inplace : bool, optional
+            Whether to fill the given DataFrame itself instead of returning a filled copy (default is False).
         """
         self.method = method
         self.fill_value = fill_value
+        self.inplace = inplace
 
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -108,32 +119,99 @@ class FillMissingValuesStrategy(MissingValuesHandlingStrategy):
         pd.DataFrame
             The DataFrame after filling missing values.
         """
-        df_cleaned = df.copy()  # Create a copy to avoid modifying the original DataFrame
+        # Unless filling in place, work on a shallow copy: filled columns are reassigned rather than
+        # written into, so the original DataFrame is left untouched without copying every column up front
+        df_cleaned = df if self.inplace else df.copy(deep=False)
         
         # Handle missing values based on the specified method
         if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df[numeric_columns].mean())
+            self._fill_numeric(df_cleaned, np.nanmean)
             
         elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df[numeric_columns].median())
+            self._fill_numeric(df_cleaned, np.nanmedian)
 
         elif self.method == "mode":
-            # Fill each column's missing values with its mode (most frequent value)
-            for column in df.columns:
-                df_cleaned[column] = df_cleaned[column].fillna(df[column].mode().iloc[0])
+            # Fill each column's missing values with its mode (most frequent value), computing the
+            # modes of all the columns with missing values in a single call. Their string columns are
+            # converted to category first, so the modes are counted on integer codes rather than by
+            # hashing Python strings; they stay categorical in the result, which downstream encoders
+            # must accept. Columns without missing values are left as they are
+            dirty_columns = self._dirty_columns(df)
+            if not dirty_columns.empty:
+                dirty = df_cleaned[dirty_columns]
+                object_columns = dirty.select_dtypes(include="object").columns
+                if not object_columns.empty:
+                    dirty = dirty.astype(dict.fromkeys(object_columns, "category"))
+                modes = dirty.mode(dropna=True)
+                # Columns that are entirely missing have no mode and stay missing; when every column
+                # with missing values is such a column there is nothing to fill at all
+                if modes.empty:
+                    logging.warning("Columns %s are entirely missing and have no mode. No missing values filled.", list(dirty_columns))
+                else:
+                    df_cleaned[dirty_columns] = dirty.fillna(modes.iloc[0])
 
         elif self.method == "constant":
-            # Fill missing values with the specified constant value
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            # Fill missing values with the specified constant value, in the columns that have any
+            dirty_columns = self._dirty_columns(df)
+            if not dirty_columns.empty:
+                df_cleaned[dirty_columns] = df_cleaned[dirty_columns].fillna(self.fill_value)
 
         else:
-            logging.warning(f"Unknown method {self.method}. No missing values handled.")
+            logging.warning("Unknown method %s. No missing values handled.", self.method)
             return df_cleaned
         
-        logging.info(f"Missing values filled with method {self.method} and fill value {self.fill_value}.")
+        logging.info("Missing values filled with method %s and fill value %s.", self.method, self.fill_value)
         return df_cleaned
+
+    @staticmethod
+    def _dirty_columns(df: pd.DataFrame) -> pd.Index:
+        """
+        Returns the columns of the DataFrame that contain missing values, found in a single isna pass.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame to inspect.
+
+        Returns:
+        -------
+        pd.Index
+            The names of the columns with at least one missing value.
+        """
+        return df.columns[df.isna().to_numpy().any(axis=0)]
+
+    @staticmethod
+    def _fill_numeric(df: pd.DataFrame, statistic: Callable[..., np.ndarray]):
+        """
+        Fills missing values in the numeric columns of the DataFrame, in place, with a column-wise statistic.
+
+        Only the columns that actually contain missing values are touched. They are extracted as one
+        float array, the statistic is computed for all of them in a single NumPy reduction, and the
+        missing entries are patched directly, without pandas' per-column alignment in fillna.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame whose numeric columns are filled.
+        statistic : Callable[..., np.ndarray]
+            A NaN-ignoring NumPy reduction such as np.nanmean or np.nanmedian, called with axis=0.
+        """
+        numeric_columns = df.select_dtypes(include="number").columns
+        numeric = df[numeric_columns]
+        dirty_columns = numeric_columns[numeric.isna().any(axis=0).to_numpy()]
+        if dirty_columns.empty:
+            return
+
+        values = numeric[dirty_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        # Columns that are entirely missing have no statistic and stay missing, as with fillna
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            fill_values = statistic(values, axis=0)
+        values[missing] = np.take(fill_values, np.nonzero(missing)[1])
+
+        # Write back in each column's original dtype
+        df[dirty_columns] = pd.DataFrame(values, index=df.index, columns=dirty_columns).astype(numeric[dirty_columns].dtypes.to_dict())
     
 
 class MissingValuesHandler:
@@ -161,7 +239,7 @@ class MissingValuesHandler:
         strategy : MissingValuesHandlingStrategy
             The new missing values handling strategy to be used.
         """
-        logging.info(f"Switching missing values handling strategy.")
+        logging.info("Switching missing values handling strategy.")
         self._strategy = strategy
 
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -1,4 +1,4 @@
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
 import logging
@@ -6,6 +6,48 @@ import logging
 # Configure logging for the script
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+
+def _regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> tuple[float, float, float]:
+    """
+    Computes MAE, MSE and R2 from a single residual array.
+
+    The residuals are formed once and reused for all three metrics, instead of each sklearn metric
+    validating its inputs and recomputing them. Results match sklearn's mean_absolute_error,
+    mean_squared_error and r2_score, including r2_score's handling of a constant target.
+
+    Parameters:
+    ----------
+    y_true : np.ndarray
+        The true target values.
+    y_pred : np.ndarray
+        The predicted target values.
+
+    Returns:
+    -------
+    tuple[float, float, float]
+        The Mean Absolute Error, Mean Squared Error and R-squared.
+    """
+    residuals = y_true - y_pred
+    n = residuals.size
+    mae = np.abs(residuals).mean()
+    ss_res = np.dot(residuals, residuals)
+    mse = ss_res / n
+
+    if n < 2:
+        # R2 is not well-defined with fewer than two samples
+        logging.warning("R^2 score is not well-defined with less than two samples.")
+        return float(mae), float(mse), float("nan")
+
+    centered = y_true - y_true.mean()
+    ss_tot = np.dot(centered, centered)
+    if ss_tot == 0:
+        # Constant target: a perfect prediction scores 1, anything else 0
+        r2 = 1.0 if ss_res == 0 else 0.0
+    else:
+        r2 = 1.0 - ss_res / ss_tot
+    return float(mae), float(mse), float(r2)
+
+
 class RegressionModelEvaluationStrategy:
     """
     A strategy class to evaluate regression models based on common metrics.
@@ -40,11 +82,11 @@ class RegressionModelEvaluationStrategy:
 
         # Calculate evaluation metrics: MAE, MSE, and R2
         logging.info("Calculating evaluation metrics.")
-        mae = mean_absolute_error(y_test, y_pred)
-        mse = mean_squared_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
+        mae, mse, r2 = _regression_metrics(
+            np.asarray(y_test, dtype=np.float64).ravel(), np.asarray(y_pred, dtype=np.float64).ravel()
+        )
 
         # Store the computed metrics in a dictionary and return
         metrics = {"MAE": mae, "MSE": mse, "R2": r2}
-        logging.info(f"Model Evaluation metrics: {metrics}")
+        logging.info("Model Evaluation metrics: %s", metrics)
         return metrics
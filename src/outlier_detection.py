@@ -3,8 +3,10 @@ from typing import Union
 import logging
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+from joblib import Parallel, delayed, effective_n_jobs
 from pathlib import Path
 
 # Configure logging for the script
@@ -31,16 +33,84 @@ class OutlierDetectionStrategy(ABC):
         Returns:
         -------
         pd.DataFrame
-            A DataFrame indicating outlier values (True for outliers, False otherwise).
+            A DataFrame indicating outlier values (True for outliers, False otherwise), with one column
+            per column checked for outliers.
         """
         pass
 
+    def row_outlier_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the rows of the DataFrame that hold an outlier in at least one checked column.
+
+        The default reduces the result of `detect_outlier`; strategies can override it to compute the
+        row mask directly, without materializing the per-cell outlier DataFrame.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data on which to perform outlier detection.
+
+        Returns:
+        -------
+        np.ndarray
+            A 1D boolean array with one entry per row, True where the row holds an outlier.
+        """
+        return self.detect_outlier(df).to_numpy().any(axis=1)
+
 
 class IQROutlierDetectionStrategy(OutlierDetectionStrategy):
     """
     A class to detect outliers using the Interquartile Range (IQR) method.
     """
     
+    # Below this many values, computing the quartiles in a single pass is faster than dispatching to threads
+    parallel_threshold = 1_000_000
+
+    def __init__(self, features: list[str] = None, n_jobs: int = -1) -> None:
+        """
+        Initializes the IQROutlierDetectionStrategy with the features used to detect outliers.
+
+        Parameters:
+        ----------
+        features : list[str], optional
+            A list of features (columns) to check for outliers. If not provided, all numeric columns are used.
+        n_jobs : int, optional
+            The number of threads used to compute the quartiles of large DataFrames (default is -1, all cores).
+        """
+        self.features = features
+        self.n_jobs = n_jobs
+
+    def _quartiles(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the first and third quartiles of each column, skipping missing values.
+
+        Large arrays are split into groups of columns whose quartiles are computed on separate threads;
+        the partitioning inside NumPy releases the GIL, so the threads run in parallel.
+
+        Parameters:
+        ----------
+        values : np.ndarray
+            A 2D float array with one column per feature.
+
+        Returns:
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The first (Q1) and third (Q3) quartiles of each column.
+        """
+        n_jobs = min(effective_n_jobs(self.n_jobs), values.shape[1])
+        if values.size < self.parallel_threshold or n_jobs <= 1:
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            return q1, q3
+
+        # Lay each column out contiguously so every thread partitions its own block of memory
+        columns = np.ascontiguousarray(values.T)
+        chunks = np.array_split(columns, n_jobs)
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(np.nanquantile)(chunk, [0.25, 0.75], axis=1) for chunk in chunks
+        )
+        q1, q3 = np.concatenate(results, axis=1)
+        return q1, q3
+
     def detect_outlier(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Detects outliers in the DataFrame using the IQR method.
@@ -53,23 +123,82 @@ class IQROutlierDetectionStrategy(OutlierDetectionStrategy):
         Returns:
         -------
         pd.DataFrame
-            A DataFrame of boolean values where True represents an outlier.
+            A DataFrame of boolean values where True represents an outlier, for the checked columns.
         """
-        logging.info("Detecting outliers using IQR method.")
-
-        # Calculate the first (Q1) and third (Q3) quartiles
-        q1 = df.quantile(0.25)
-        q3 = df.quantile(0.75)
-        
-        # Compute the Interquartile Range (IQR)
-        IQR = q3 - q1
+        values, lower, upper, columns_to_detect = self._fences(df)
         
         # Identify outliers where values are less than Q1 - 1.5*IQR or greater than Q3 + 1.5*IQR
-        outliers = (df < q1 - 1.5 * IQR) | (df > q3 + 1.5 * IQR)
+        with np.errstate(invalid="ignore"):
+            mask = (values < lower) | (values > upper)
+        outliers = pd.DataFrame(mask, index=df.index, columns=columns_to_detect)
         
         logging.info("Outliers detected using the IQR method.")
         return outliers
 
+    def row_outlier_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the rows of the DataFrame that hold an IQR outlier in at least one checked column.
+
+        The columns are compared against their fences one at a time and OR-ed straight into one row
+        mask, so no per-cell outlier DataFrame is built.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data to analyze for outliers.
+
+        Returns:
+        -------
+        np.ndarray
+            A 1D boolean array with one entry per row, True where the row holds an outlier.
+        """
+        values, lower, upper, _ = self._fences(df)
+
+        row_outliers = np.zeros(len(df), dtype=np.bool_)
+        column_outliers = np.empty(len(df), dtype=np.bool_)
+        with np.errstate(invalid="ignore"):
+            for j in range(values.shape[1]):
+                np.less(values[:, j], lower[j], out=column_outliers)
+                row_outliers |= column_outliers
+                np.greater(values[:, j], upper[j], out=column_outliers)
+                row_outliers |= column_outliers
+
+        logging.info("Outliers detected using the IQR method.")
+        return row_outliers
+
+    def _fences(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, Union[list[str], pd.Index]]:
+        """
+        Computes the lower and upper outlier fences of the checked columns.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data to analyze for outliers.
+
+        Returns:
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, Union[list[str], pd.Index]]
+            A float32 (n_rows, n_columns) array of the checked columns (NaN where a value is missing),
+            the lower (Q1 - 1.5*IQR) and upper (Q3 + 1.5*IQR) fence of each column, and the column names.
+        """
+        # Select columns to detect outliers (specified features or all numeric columns, as only those can hold outliers)
+        if self.features:
+            logging.info("Detecting outliers in columns: %s using IQR method.", self.features)
+            columns_to_detect = self.features
+        else:
+            logging.info("Detecting outliers using IQR method.")
+            columns_to_detect = df.select_dtypes(include="number").columns
+
+        # Work on a single contiguous float32 array of the checked columns
+        values = np.ascontiguousarray(df[columns_to_detect].to_numpy(dtype=np.float32, na_value=np.nan))
+
+        # Calculate the first (Q1) and third (Q3) quartiles of each column, skipping missing values
+        q1, q3 = self._quartiles(values)
+        
+        # Compute the Interquartile Range (IQR)
+        IQR = q3 - q1
+        return values, q1 - 1.5 * IQR, q3 + 1.5 * IQR, columns_to_detect
+
     
 class ZScoreOutlierDetectionStrategy(OutlierDetectionStrategy):
     """
@@ -102,27 +231,88 @@ class ZScoreOutlierDetectionStrategy(OutlierDetectionStrategy):
         Returns:
         -------
         pd.DataFrame
-            A DataFrame of boolean values where True represents an outlier.
+            A DataFrame of boolean values where True represents an outlier, for the checked columns.
+        """
+        zscores, columns_to_detect = self._abs_zscores(df)
+
+        # Mark values as outliers where Z-score exceeds the threshold (missing values never are)
+        mask = np.empty(zscores.shape, dtype=np.bool_)
+        with np.errstate(invalid="ignore"):
+            np.greater(zscores, self.threshold, out=mask)
+        outliers = pd.DataFrame(mask, index=df.index, columns=columns_to_detect)
+
+        logging.info("Outliers detected using the Z Score method.")
+        return outliers
+
+    def row_outlier_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the rows of the DataFrame that hold a Z-score outlier in at least one checked column.
+
+        The per-column comparisons are OR-ed straight into one row mask, so no per-cell outlier
+        DataFrame is built.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data for outlier detection.
+
+        Returns:
+        -------
+        np.ndarray
+            A 1D boolean array with one entry per row, True where the row holds an outlier.
+        """
+        zscores, _ = self._abs_zscores(df)
+
+        row_outliers = np.zeros(len(df), dtype=np.bool_)
+        column_outliers = np.empty(len(df), dtype=np.bool_)
+        with np.errstate(invalid="ignore"):
+            for j in range(zscores.shape[1]):
+                np.greater(zscores[:, j], self.threshold, out=column_outliers)
+                row_outliers |= column_outliers
+
+        logging.info("Outliers detected using the Z Score method.")
+        return row_outliers
+
+    def _abs_zscores(self, df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
         """
-        # Initialize a DataFrame with False values indicating no outliers
-        outliers = pd.DataFrame(False, index=df.index, columns=df.columns)
+        Computes the absolute Z-scores of the checked columns.
+
+        Parameters:
+        ----------
+        df : pd.DataFrame
+            The DataFrame containing the data for outlier detection.
 
+        Returns:
+        -------
+        tuple[np.ndarray, list[str]]
+            A float32 (n_rows, n_columns) array of absolute Z-scores (NaN where a value is missing),
+            and the names of the checked columns.
+        """
         # Select columns to detect outliers (specified features or all numeric columns)
         if self.features:
-            logging.info(f"Detecting outliers in columns: {self.features} using the Z Score method with threshold: {self.threshold}")
+            logging.info("Detecting outliers in columns: %s using the Z Score method with threshold: %s", self.features, self.threshold)
             columns_to_detect = self.features
         else:
-            logging.info(f"Detecting outliers in all numeric features using the Z Score method with threshold: {self.threshold}")
+            logging.info("Detecting outliers in all numeric features using the Z Score method with threshold: %s", self.threshold)
             columns_to_detect = list(df.select_dtypes(include="number").columns)
 
-        # Calculate Z-scores for the selected columns
-        zscores = np.abs((df[columns_to_detect] - df[columns_to_detect].mean()) / df[columns_to_detect].std())
-
-        # Mark values as outliers where Z-score exceeds the threshold
-        outliers[columns_to_detect] = zscores > self.threshold
-
-        logging.info("Outliers detected using the Z Score method.")
-        return outliers
+        # Calculate Z-scores for the selected columns on a single float32 array, skipping missing
+        # values and using the sample standard deviation like pandas does. The |x - mean| / std chain
+        # runs in place on that array, so no further temporaries are allocated
+        # The array is always a copy: a float32 column would otherwise come back as a view of the caller's
+        # data, which the in-place chain below would then overwrite
+        if len(columns_to_detect) == 1:
+            # Single feature (e.g. SalePrice): read the column directly rather than building a
+            # one-column sub-DataFrame, and view it as a single-column array
+            values = df[columns_to_detect[0]].to_numpy(dtype=np.float32, na_value=np.nan, copy=True).reshape(-1, 1)
+        else:
+            values = df[columns_to_detect].to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+        std = np.nanstd(values, axis=0, ddof=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.subtract(values, np.nanmean(values, axis=0), out=values)
+            np.abs(values, out=values)
+            np.divide(values, std, out=values)
+        return values, columns_to_detect
     
 
 class OutliersDetector:
@@ -167,7 +357,7 @@ class OutliersDetector:
         Returns:
         -------
         pd.DataFrame
-            A DataFrame indicating outliers (True for outliers, False otherwise).
+            A DataFrame indicating outliers (True for outliers, False otherwise), for the checked columns.
         """
         logging.info("Performing outlier detection.")
         return self._strategy.detect_outlier(df)
@@ -189,20 +379,27 @@ class OutliersDetector:
             The cleaned DataFrame after handling outliers.
         """
         if method == "remove":
-            # Detect and remove rows with outliers
-            outliers = self.detect_outliers(df)
+            # Detect and remove rows with outliers, using the strategy's row mask directly
+            logging.info("Performing outlier detection.")
+            row_outliers = self._strategy.row_outlier_mask(df)
             logging.info("Removing outliers from the dataset")
-            cleaned_df = df[~(outliers).any(axis=1)]
+            cleaned_df = df[~row_outliers]
         elif method == "cap":
-            # Cap the values at the 1st and 99th percentiles
+            # Cap the numeric values at their 1st and 99th percentiles, computing both percentiles in a
+            # single pass and clipping in place on one array of the numeric columns
             logging.info("Capping outliers in the dataset")
-            cleaned_df = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=0)
+            numeric_columns = df.select_dtypes(include="number").columns
+            values = df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            lower, upper = np.nanquantile(values, [0.01, 0.99], axis=0)
+            np.clip(values, lower, upper, out=values)
+            cleaned_df = df.copy(deep=False)
+            cleaned_df[numeric_columns] = values
         else:
-            logging.warning(f"Unsupported method {method}. No outliers handled.")
+            logging.warning("Unsupported method %s. No outliers handled.", method)
             return df
         
         logging.info("Outlier handling completed.")
-        logging.info(f"Shape of cleaned df is : {cleaned_df.shape}")
+        logging.info("Shape of cleaned df is : %s", cleaned_df.shape)
         return cleaned_df
     
 
@@ -210,6 +407,9 @@ class OutliersDetector:
         """
         Visualizes outliers in the specified features using heatmaps and boxplots.
 
+        All the plots are drawn on a single figure, with one row per feature holding its outlier
+        heatmap next to its boxplot.
+
         Parameters:
         ----------
         df : pd.DataFrame
@@ -217,29 +417,29 @@ class OutliersDetector:
         features : list[str]
             The list of features (columns) to visualize outliers for.
         """
-        outliers = self._strategy.detect_outlier(df)
-        print("Visualizing detected outliers...")
-
-        # Generate heatmaps for each feature's outliers
-        for feature in features:
-            plt.figure(figsize=(10,8))
-            sns.heatmap(outliers[feature], cbar=True, cmap="viridis")
-            plt.title(f"Heatmap of {feature}")
-            plt.show()
-
-        print("Visualize outliers using boxplots...")
-
-        # Generate boxplots for each feature
-        for feature in features:
-            plt.figure(figsize=(10,8))
-            sns.boxplot(x=df[feature])
-            plt.title(f"Boxplot of {feature}")
+        # Features that were not checked for outliers have none
+        outliers = self._strategy.detect_outlier(df).reindex(columns=features, fill_value=False)
+        print("Visualizing detected outliers using heatmaps and boxplots...")
+
+        fig, axes = plt.subplots(len(features), 2, figsize=(16, 4 * len(features)), squeeze=False)
+        for i, feature in enumerate(features):
+            # Heatmap of the feature's outliers
+            sns.heatmap(outliers[[feature]], ax=axes[i, 0], cbar=True, cmap="viridis")
+            axes[i, 0].set_title(f"Heatmap of {feature}")
+
+            # Boxplot of the feature
+            sns.boxplot(x=df[feature], ax=axes[i, 1])
+            axes[i, 1].set_title(f"Boxplot of {feature}")
+        fig.tight_layout()
+
+        # Non-interactive backends cannot show the figure; it is left open for the caller to save
+        if matplotlib.get_backend().lower() != "agg":
             plt.show()
 
 
 if __name__ == "__main__":
     # Load the dataset
-    df = pd.read_csv(Path(__file__).parent.parent / "extracted_data" / "AmesHousing.csv")
+    df = pd.read_csv(Path(__file__).parent.parent / "extracted_data" / "AmesHousing.csv", engine="pyarrow", dtype_backend="pyarrow")
     print(f"Shape of original df: {df.shape}")
 
     # Initialize outlier detector with Z-score strategy
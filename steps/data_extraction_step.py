@@ -1,12 +1,24 @@
+import hashlib
+import os
 import pandas as pd
 from data_ingestion.data_ingestion import DataExtractionFactory
 from zenml import step
 
 
-@step
-def data_extraction_step(file_path: str) -> pd.DataFrame:
+def file_fingerprint(file_path: str) -> str:
+    """
+    Returns a fingerprint of a data file's path, modification time and size, to pass to data_extraction_step.
+    """
+    stat = os.stat(file_path)
+    return hashlib.blake2b(f"{os.path.abspath(file_path)}-{stat.st_mtime_ns}-{stat.st_size}".encode(), digest_size=8).hexdigest()
 
-    file_extension = file_path.split(".")[-1]
-    data_extractor = DataExtractionFactory().get_data_extractor(file_extension)
+
+# ZenML's cache key covers the step's parameters, not the file's contents, so callers pass the file's
+# fingerprint as well: the cached output is reused while the file is unchanged and recomputed once it changes
+@step(enable_cache=True)
+def data_extraction_step(file_path: str, fingerprint: str) -> pd.DataFrame:
+
+    file_extension = os.path.splitext(file_path)[1][1:]
+    data_extractor = DataExtractionFactory.get_data_extractor(file_extension)
     df = data_extractor.extract(file_path)
     return df
@@ -0,0 +1,29 @@
+from zenml import step
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+@step(enable_cache=True)
+def downcast_step(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcasts the DataFrame's columns to the smallest dtypes that hold their values.
+
+    Float columns become float32 where possible, integer columns the smallest integer type that fits,
+    and object (string) columns become category, so every later step moves far fewer bytes per pass.
+    """
+    memory_before = df.memory_usage(deep=True).sum()
+    df_downcast = df.copy(deep=False)
+
+    for column in df.select_dtypes(include="float").columns:
+        df_downcast[column] = pd.to_numeric(df[column], downcast="float")
+
+    for column in df.select_dtypes(include="integer").columns:
+        df_downcast[column] = pd.to_numeric(df[column], downcast="integer")
+
+    for column in df.select_dtypes(include="object").columns:
+        df_downcast[column] = df[column].astype("category")
+
+    memory_after = df_downcast.memory_usage(deep=True).sum()
+    logging.info("Downcast DataFrame dtypes, memory usage reduced from %.2f MB to %.2f MB.", memory_before / 1e6, memory_after / 1e6)
+    return df_downcast
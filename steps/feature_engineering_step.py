@@ -1,23 +1,54 @@
-from src.feature_engineering import FeatureEngineer, LogTransformationStrategy, StandardScalingStrategy, MinMaxScalingStrategy, OneHotEncodingStrategy
+from src.feature_engineering import FeatureEngineer, FeatureEngineeringStrategy, LogTransformationStrategy, StandardScalingStrategy, MinMaxScalingStrategy, OneHotEncodingStrategy
+import os
 import pandas as pd
+from typing import Optional
 from zenml import step
 
-@step
-def feature_engineering_step(df: pd.DataFrame, strategy: str, features: list[str]) -> pd.DataFrame:
-    if strategy == "log":
-        feature_transformer = FeatureEngineer(LogTransformationStrategy(features))
-    
-    elif strategy == "min-max":
-        feature_transformer = FeatureEngineer(MinMaxScalingStrategy(features))
-    
-    elif strategy == "standard_scaler":
-        feature_transformer = FeatureEngineer(StandardScalingStrategy(features))
-    
-    elif strategy == "one-hot":
-        feature_transformer = FeatureEngineer(OneHotEncodingStrategy(features))
-        
-    else:
-        raise ValueError(f"Unsupported feature engineering strategy : {strategy}")
+# Maps each strategy name accepted by the step to the class implementing it
+_STRATEGIES: dict[str, type[FeatureEngineeringStrategy]] = {
+    "log": LogTransformationStrategy,
+    "min-max": MinMaxScalingStrategy,
+    "standard_scaler": StandardScalingStrategy,
+    "one-hot": OneHotEncodingStrategy,
+}
 
+# Not cached: the step reads and writes the fitted strategy at artifact_path, which ZenML's cache key does not
+# cover, so a cached run could return output built with a stale strategy or skip saving a refitted one
+@step(enable_cache=False)
+def feature_engineering_step(
+    df: pd.DataFrame, strategy: str, features: list[str], artifact_path: Optional[str] = None, fit: bool = True
+) -> pd.DataFrame:
+    """
+    Applies a feature engineering strategy to the DataFrame.
+
+    With fit=True (the default) the strategy is fitted on df, and saved to artifact_path when one is given.
+    With fit=False the strategy fitted by an earlier run is loaded from artifact_path and only applied, so
+    its statistics stay those of the data it was fitted on.
+    """
+    try:
+        strategy_class = _STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"Unsupported feature engineering strategy : {strategy}") from None
+
+    if not fit:
+        if artifact_path is None or not os.path.exists(artifact_path):
+            raise ValueError(f"No fitted feature engineering strategy found at: {artifact_path}")
+        fitted_strategy = FeatureEngineeringStrategy.load(artifact_path)
+        if type(fitted_strategy) is not strategy_class or fitted_strategy.features != features:
+            raise ValueError(
+                f"Strategy saved at {artifact_path} is {type(fitted_strategy).__name__} on {fitted_strategy.features}, "
+                f"not {strategy_class.__name__} on {features}"
+            )
+        columns = set(df.columns)
+        missing_features = [feature for feature in fitted_strategy.features if feature not in columns]
+        if missing_features:
+            raise ValueError(f"Column {missing_features} does not exist in the dataframe.")
+        return FeatureEngineer(fitted_strategy).transform(df)
+
+    feature_strategy = strategy_class(features)
+    feature_transformer = FeatureEngineer(feature_strategy)
     df_transformed = feature_transformer.apply_transformation(df)
-    return df_transformed
\ No newline at end of file
+
+    if artifact_path is not None:
+        feature_strategy.save(artifact_path)
+    return df_transformed
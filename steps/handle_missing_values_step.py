@@ -4,7 +4,7 @@ from typing import Any
 from zenml import step
 
 
-@step
+@step(enable_cache=True)
 def handle_missing_values_step(df: pd.DataFrame, method: str = "mean", fill_value: Any = None) -> pd.DataFrame:
     if method == "drop":
         handler = MissingValuesHandler(DropMissingValuesStrategy())
@@ -0,0 +1,29 @@
+from src.fused_kernels import log1p_zscore_mask
+from typing import Union
+from zenml import step
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+@step(enable_cache=True)
+def log_zscore_outlier_step(df: pd.DataFrame, features: list[str], threshold: Union[int, float] = 3) -> pd.DataFrame:
+    """
+    Log-transforms the given features and removes the rows that are Z-score outliers on the transformed values.
+
+    Equivalent to a "log" feature engineering step followed by a "ZScore" outlier detection step with method
+    "remove" on the same features, but the data is only read and copied once.
+    """
+    missing = [feature for feature in features if feature not in df.columns]
+    if missing:
+        logging.error("Column %s does not exist in the dataframe.", missing)
+        raise ValueError(f"Column {missing} does not exist in the dataframe.")
+
+    logging.info("Applying log transformation and Z Score outlier removal on features: %s with threshold: %s", features, threshold)
+    values, keep = log1p_zscore_mask(df[features].to_numpy(), threshold)
+
+    cleaned_df = df[keep].copy()
+    cleaned_df[features] = values[keep]
+
+    logging.info("Shape of cleaned df is : %s", cleaned_df.shape)
+    return cleaned_df
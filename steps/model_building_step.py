@@ -1,7 +1,11 @@
 import logging
-from typing import Annotated
+import os
+from pathlib import Path
+from typing import Annotated, Tuple
 
+import joblib
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
 from sklearn.compose import ColumnTransformer
@@ -21,56 +25,84 @@ model = Model(
     description="Price prediction model for houses.",
 )
 
+# Fitted preprocessing transformers are memoized on disk, so a refit on the same training data reuses them.
+# Set DISABLE_SK_CACHE to turn this off, e.g. when relying on ZenML's step cache instead
+memory = None if os.environ.get("DISABLE_SK_CACHE") else joblib.Memory(location=Path(__file__).parent.parent / ".sk_cache", verbose=0)
+
+# Autologging patches sklearn once for the whole process, so it is enabled here rather than on every fit
+mlflow.sklearn.autolog(log_models=True, silent=True, disable_for_unsupported_versions=True)
+
 @step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
-def model_building_step(X_train: pd.DataFrame, y_train: pd.Series) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
+def model_building_step(X_train: pd.DataFrame, y_train: pd.Series) -> Tuple[
+    Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)],
+    Annotated[list[str], ArtifactConfig(name="expected_columns")],
+]:
 
-    categorical_columns = X_train.select_dtypes(include=["object", "category"]).columns
-    numerical_columns = X_train.select_dtypes(exclude=["object", "category"]).columns
+    # Split the columns into categorical and numerical ones in a single pass over the dtypes
+    dtypes = X_train.dtypes
+    is_categorical = np.fromiter(
+        (dtype == object or isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes), dtype=bool, count=len(dtypes)
+    )
+    categorical_columns = dtypes.index[is_categorical]
+    numerical_columns = dtypes.index[~is_categorical]
 
-    logging.info(f"Categorical columns: {categorical_columns.tolist()}")
-    logging.info(f"Numerical columns: {numerical_columns.tolist()}")
+    logging.info("Categorical columns: %s", categorical_columns.tolist())
+    logging.info("Numerical columns: %s", numerical_columns.tolist())
 
     numerical_transformer = SimpleImputer(strategy="mean")
-    categorical_transformer = Pipeline(
-        steps=[
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore"))
-        ]
-    )
+    # Hand the encoder each column's categories up front: category columns (as the downcast step produces)
+    # already carry them, so the encoder skips its own search for the unique values. Missing values are
+    # encoded as a category of their own (which the encoder requires last), so the categorical block is
+    # read once by the encoder rather than first by an imputer
+    categories = []
+    for column in categorical_columns:
+        column_categories = X_train[column].astype("category").cat.categories.to_numpy()
+        if X_train[column].isna().any():
+            column_categories = np.append(column_categories.astype(object), np.nan)
+        categories.append(column_categories)
+
+    categorical_transformer = OneHotEncoder(categories=categories, handle_unknown="ignore", sparse_output=False)
 
     preprocessor = ColumnTransformer(
         transformers=[
             ("num", numerical_transformer, numerical_columns),
             ("cat", categorical_transformer, categorical_columns)
-        ]
+        ],
+        # Always emit a dense matrix: on sparse input LinearRegression falls back to the iterative lsqr
+        # solver, which stops well short of the exact least-squares fit on these unscaled features
+        sparse_threshold=0,
+        # The numerical and categorical branches are independent, so they are fitted concurrently
+        n_jobs=2,
     )
 
-    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())], memory=memory)
 
     if not mlflow.active_run():
         mlflow.start_run()
 
     try:
-        mlflow.sklearn.autolog()
-
         logging.info("Building and training Linear Regression model")
-        pipeline.fit(X_train, y_train)
+        # Fit on joblib's threading backend: the ColumnTransformer branches run as threads in this process
+        # instead of spawning worker processes, which costs more than the fits themselves at this scale
+        with joblib.parallel_backend("threading", n_jobs=-1):
+            pipeline.fit(X_train, y_train)
         logging.info("Model training completed.")
 
-        onehot_encoder = (
-            pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        )
-        onehot_encoder.fit(X_train[categorical_columns])
-        expected_columns = numerical_columns.to_list() + list(onehot_encoder.get_feature_names_out(categorical_columns))
+        # The encoder was fitted as part of the pipeline, so its feature names are already known
+        onehot_encoder = pipeline.named_steps["preprocessor"].named_transformers_["cat"]
+        feature_names = onehot_encoder.get_feature_names_out(categorical_columns)
+        logging.info("Model is trained on the following features: %s", numerical_columns.to_list() + feature_names.tolist())
 
-        logging.info(f"Model expects the following columns: {expected_columns}")
+        # The input columns, in training order, are saved alongside the model so the predictor can lay out its inputs
+        expected_columns = X_train.columns.to_list()
+        logging.info("Model expects the following columns: %s", expected_columns)
 
     except Exception as e:
-        logging.error(f"Error occured during model training: {e}")
+        logging.error("Error occured during model training: %s", e)
         raise e
     
     finally:
         mlflow.end_run()
     
-    return pipeline
+    return pipeline, expected_columns
     
\ No newline at end of file
@@ -1,26 +1,42 @@
 from src.outlier_detection import OutliersDetector, ZScoreOutlierDetectionStrategy, IQROutlierDetectionStrategy, OutlierDetectionStrategy
 from zenml import step
+from functools import lru_cache
+from typing import Optional
 import pandas as pd
 import logging 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+
+# The strategies hold only their constructor arguments and no fitted state, so one instance per
+# configuration is safely shared by every run of the step
+@lru_cache(maxsize=16)
+def _zscore_strategy(features: Optional[tuple[str, ...]]) -> ZScoreOutlierDetectionStrategy:
+    return ZScoreOutlierDetectionStrategy(features=list(features) if features is not None else None)
+
+
+@lru_cache(maxsize=16)
+def _iqr_strategy(features: Optional[tuple[str, ...]]) -> IQROutlierDetectionStrategy:
+    return IQROutlierDetectionStrategy(features=list(features) if features is not None else None)
+
 @step
 def outlier_detection_step(df: pd.DataFrame, strategy: str, method: str = "remove", features: list[str] = None):
     if strategy == "ZScore":
-        outlier_detector = OutliersDetector(ZScoreOutlierDetectionStrategy(features=features))
+        outlier_detector = OutliersDetector(_zscore_strategy(tuple(features) if features is not None else None))
     elif strategy == "IQR":
-        outlier_detector = OutliersDetector(IQROutlierDetectionStrategy())
+        outlier_detector = OutliersDetector(_iqr_strategy(tuple(features) if features is not None else None))
     else:
-        logging.error(f"Unexpected outlier detection strategy : {strategy}")
+        logging.error("Unexpected outlier detection strategy : %s", strategy)
         raise ValueError(f"Unexpected outlier detection strategy : {strategy}")
 
-    if all([feature in df.columns for feature in features]):
-        cleaned_df = outlier_detector.handle_outliers(df=df, method=method)
+    # Without features, every numeric column is checked, so there is nothing to validate
+    columns = set(df.columns)
+    missing_features = [feature for feature in features if feature not in columns] if features is not None else []
+    if missing_features:
+        logging.error("Column %s does not exist in the dataframe.", missing_features)
+        raise ValueError(f"Column {missing_features} does not exist in the dataframe.")
 
-    else:
-        logging.error(f"Column {features} does not exist in the dataframe.")
-        raise ValueError(f"Column {features} does not exist in the dataframe.")
+    cleaned_df = outlier_detector.handle_outliers(df=df, method=method)
     
-    logging.info(f"Shape of cleaned df is : {cleaned_df.shape}")
+    logging.info("Shape of cleaned df is : %s", cleaned_df.shape)
     return cleaned_df
\ No newline at end of file
@@ -1,31 +1,41 @@
 from zenml import step
+from zenml.client import Client
 from zenml.integrations.mlflow.services import MLFlowDeploymentService
 
 import numpy as np
+import orjson
 import pandas as pd
-import json
 
 @step(enable_cache=False)
 def predictor(
     service: MLFlowDeploymentService,
-    input_data: str
+    input_data: str,
+    batch_size: int = 4096
 ) -> np.ndarray:
     
-    service.start(timeout=10)
+    # Starting an already running service only waits on its status, so skip it
+    if not service.is_running:
+        service.start(timeout=10)
 
-    data = json.loads(input_data)
+    # orjson parses the payload in a single pass in C; its output matches json.loads
+    data = orjson.loads(input_data)
 
-    data.pop("columns", None)
+    columns = data.pop("columns", None)
     data.pop("index", None)
 
-    expected_columns = [
+    # Loaded on every run rather than kept across runs, so a retrained model's columns are picked up
+    expected_columns = Client().get_artifact_version("expected_columns").load()
 
-    ]
-
-    df = pd.DataFrame(data["data"], columns=expected_columns)
-    json_list = json.loads(json.dumps(list(df.T.to_dict().values)))
+    # The frame only puts the columns in the order the model expects; its values go to the service
+    # as one array. String features are kept as objects, since the served pipeline one-hot encodes them
+    df = pd.DataFrame(data["data"], columns=columns if columns is not None else expected_columns)
+    data_array = df[expected_columns].to_numpy()
 
-    data_array = np.array(json_list)
-
-    prediction = service.predict(data_array)
-    return prediction
\ No newline at end of file
+    # Send the rows in batches of at most batch_size, one request each, so large inputs do not become
+    # one oversized request and small ones still go in a single round trip
+    if len(data_array) <= batch_size:
+        return service.predict(data_array)
+    predictions = [
+        service.predict(data_array[start:start + batch_size]) for start in range(0, len(data_array), batch_size)
+    ]
+    return np.concatenate(predictions)
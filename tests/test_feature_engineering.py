@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import FeatureEngineer, OneHotEncodingStrategy
+
+
+class OneHotEncodingTest(unittest.TestCase):
+    """
+    Tests that one-hot encoding keeps categories unseen during fit apart from the known ones.
+    """
+
+    def setUp(self):
+        self.train_df = pd.DataFrame({
+            "style": ["a", "b", "a", "b"],
+            "area": np.arange(4, dtype=np.float32),
+        })
+        self.test_df = pd.DataFrame({
+            "style": ["a", "b", "c"],
+            "area": np.arange(3, dtype=np.float32),
+        })
+
+    def test_unseen_category_is_distinct_from_known_ones(self):
+        strategy = OneHotEncodingStrategy(["style"]).fit(self.train_df)
+        encoded = FeatureEngineer(strategy).transform(self.test_df)
+        encoded_values = encoded[["style_a", "style_b"]].sparse.to_dense().to_numpy()
+
+        np.testing.assert_array_equal(encoded_values, [[1, 0], [0, 1], [0, 0]])
+        self.assertFalse((encoded_values[2] == encoded_values[0]).all())
+        pd.testing.assert_series_equal(encoded["area"], self.test_df["area"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.handle_missing_values import FillMissingValuesStrategy
+
+
+class ModeFillMissingValuesTest(unittest.TestCase):
+    """
+    Tests mode imputation on columns that are entirely missing.
+    """
+
+    def test_entirely_missing_columns_are_left_missing(self):
+        df = pd.DataFrame({
+            "Alley": pd.Series([np.nan, np.nan, np.nan], dtype=object),
+            "Pool Area": [np.nan, np.nan, np.nan],
+            "Lot Area": [8450, 9600, 11250],
+        })
+        original = df.copy()
+
+        with self.assertLogs(level="WARNING"):
+            df_cleaned = FillMissingValuesStrategy(method="mode").handle(df)
+
+        pd.testing.assert_frame_equal(df_cleaned, original)
+        pd.testing.assert_frame_equal(df, original)
+
+    def test_entirely_missing_column_next_to_fillable_one(self):
+        df = pd.DataFrame({
+            "Alley": pd.Series([np.nan, np.nan, np.nan], dtype=object),
+            "Lot Frontage": [65.0, np.nan, 65.0],
+        })
+
+        df_cleaned = FillMissingValuesStrategy(method="mode").handle(df)
+
+        self.assertEqual(df_cleaned["Lot Frontage"].tolist(), [65.0, 65.0, 65.0])
+        self.assertTrue(df_cleaned["Alley"].isna().all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.outlier_detection import OutliersDetector, ZScoreOutlierDetectionStrategy
+
+
+class ZScoreOutlierDetectionTest(unittest.TestCase):
+    """
+    Tests that Z-score outlier detection leaves its input DataFrame untouched.
+    """
+
+    def setUp(self):
+        values = np.append(np.arange(50), 1000)
+        self.df = pd.DataFrame({
+            "price": values.astype(np.float32),
+            "area": np.arange(51, dtype=np.float32),
+        })
+        self.original = self.df.copy()
+
+    def test_single_float32_feature_is_not_modified(self):
+        detector = OutliersDetector(ZScoreOutlierDetectionStrategy(["price"]))
+        cleaned_df = detector.handle_outliers(self.df, method="remove")
+
+        pd.testing.assert_frame_equal(self.df, self.original)
+        pd.testing.assert_frame_equal(cleaned_df, self.original.iloc[:50])
+
+    def test_multiple_float32_features_are_not_modified(self):
+        strategy = ZScoreOutlierDetectionStrategy(["price", "area"])
+        strategy.detect_outlier(self.df)
+        strategy.row_outlier_mask(self.df)
+
+        pd.testing.assert_frame_equal(self.df, self.original)
+
+
+if __name__ == "__main__":
+    unittest.main()